@@ -21,4 +21,7 @@ START_MONEY = 10000
 RESULT_FILE = os.path.join(BASE_PATH, 'game_result.log')
 
 # Logging configuration
-CLIENT_LOG_FILE = os.path.join(BASE_PATH, 'poker_client.log')
\ No newline at end of file
+CLIENT_LOG_FILE = os.path.join(BASE_PATH, 'poker_client.log')
+
+# Print bot callback traces; keep off for tournament/simulation runs
+BOT_DEBUG = False
\ No newline at end of file
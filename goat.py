@@ -1,10 +1,13 @@
 import random
+from array import array
 from enum import Enum
-from collections import Counter
-from typing import List, Tuple
+from itertools import combinations, combinations_with_replacement
+from operator import attrgetter
+from typing import List, Optional, Tuple
 
 # Make sure you have these imports from your competition framework
 from bot import Bot
+from config import BOT_DEBUG
 from type.poker_action import PokerAction
 from type.round_state import RoundStateClient
 
@@ -30,108 +33,233 @@ class HandCategory(Enum):
     WEAK_DRAW = 0.5     # Gutshot straight draws
     AIR = 0             # No made hand, no significant draw
 
+# Plain ints for the per-decision category comparisons in get_action
+MONSTER_V = HandCategory.MONSTER.value
+STRONG_MADE_V = HandCategory.STRONG_MADE.value
+MEDIUM_MADE_V = HandCategory.MEDIUM_MADE.value
+WEAK_MADE_V = HandCategory.WEAK_MADE.value
+STRONG_DRAW_V = HandCategory.STRONG_DRAW.value
+AIR_V = HandCategory.AIR.value
+
+# --- Cactus Kev card encoding ---
+# Each card is a 32-bit int: xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+# (b = rank bit, cdhs = suit bit, r = rank index, p = rank prime).
+
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SUIT_BITS = {'c': 0x8, 'd': 0x4, 'h': 0x2, 's': 0x1}
+RANK_CHARS = '23456789TJQKA'
+
+CARD_INT = {}
+for _r, _rank_char in enumerate(RANK_CHARS):
+    for _suit, _suit_bit in SUIT_BITS.items():
+        _code = (1 << (16 + _r)) | (_suit_bit << 12) | (_r << 8) | RANK_PRIMES[_r]
+        CARD_INT[_rank_char + _suit] = _code
+        if _rank_char == 'T':
+            CARD_INT['10' + _suit] = _code
+
+DECK = tuple(CARD_INT[r + s] for r in RANK_CHARS for s in SUIT_BITS)
+
 class Card:
     """Represents a single playing card."""
     def __init__(self, card_str: str):
         if not card_str:
             self.rank = 0
             self.suit = ''
+            self.code = 0
             return
-        rank_str = card_str[:-1]
         self.suit = card_str[-1]
-
-        rank_map = {'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
-        try:
-            self.rank = int(rank_map.get(rank_str, rank_str))
-        except ValueError:
-            self.rank = 0 # Handle potential empty strings or malformed card data gracefully
+        self.code = CARD_INT.get(card_str, 0)
+        # Malformed card data is handled gracefully as rank 0
+        self.rank = ((self.code >> 8) & 0xF) + 2 if self.code else 0
 
     def __repr__(self):
         if self.rank == 0: return ""
         rank_map_rev = {10: 'T', 11: 'J', 12: 'Q', 13: 'K', 14: 'A'}
         return f"{rank_map_rev.get(self.rank, str(self.rank))}{self.suit}"
 
+# Cards are never mutated, so every known card string maps to one shared instance
+_CARD_CACHE = {card_str: Card(card_str) for card_str in CARD_INT}
+
+def get_card(card_str: str) -> Card:
+    card = _CARD_CACHE.get(card_str)
+    return card if card is not None else Card(card_str)
+
+def _pack_hand_value(rank: HandRank, kickers: List[int]) -> int:
+    """Packs a hand rank and up to five kickers into one comparable int."""
+    value = rank.value
+    for i in range(5):
+        value = (value << 4) | (kickers[i] if i < len(kickers) else 0)
+    return value
+
+def _unpack_hand_value(value: int) -> Tuple[HandRank, List[int]]:
+    kickers = []
+    for shift in (16, 12, 8, 4, 0):
+        kicker = (value >> shift) & 0xF
+        if not kicker: break
+        kickers.append(kicker)
+    return HandRank(value >> 20), kickers
+
+def _suit_masks(codes: List[int]) -> List[int]:
+    """Returns 13-bit rank masks for clubs, diamonds, hearts and spades (bit i = rank i+2)."""
+    masks = [0] * 9
+    for code in codes:
+        masks[(code >> 12) & 0xF] |= code >> 16
+    return [masks[8], masks[4], masks[2], masks[1]]
+
+def _paired_ranks(suit_masks: List[int]) -> int:
+    """Rank mask of every rank held in at least two suits."""
+    s_c, s_d, s_h, s_s = suit_masks
+    return (s_c & s_d) | (s_c & s_h) | (s_c & s_s) | (s_d & s_h) | (s_d & s_s) | (s_h & s_s)
+
+def _rank_hist(ranks: List[int]) -> List[int]:
+    """Count of each rank, indexed directly by rank (2-14)."""
+    hist = [0] * 15
+    for r in ranks:
+        hist[r] += 1
+    return hist
+
 class HandEvaluator:
     """Evaluates a 5-7 card hand to find its best 5-card combination."""
 
-    def evaluate(self, hand: List[Card], community: List[Card]) -> Tuple[HandRank, List[int]]:
-        all_cards = sorted(hand + community, key=lambda c: c.rank, reverse=True)
-        if len(all_cards) < 5:
+    def evaluate(self, hand: List[int], community: List[int]) -> Tuple[HandRank, List[int]]:
+        """Evaluates card codes (see CARD_INT) for the hole cards and the board."""
+        # Unknown cards parse to code 0 and are left out of the hand
+        all_codes = [code for code in hand + community if code]
+        if len(all_codes) < 5:
             # Not enough cards for a full hand, can still evaluate pairs/draws
-            return self._evaluate_preliminary(all_cards)
-
-        from itertools import combinations
-        best_rank = HandRank.HIGH_CARD
-        best_kickers = [c.rank for c in all_cards][:5]
-
-        for combo in combinations(all_cards, 5):
-            combo = list(combo)
-            rank, kickers = self._evaluate_five_card_hand(combo)
-            if rank.value > best_rank.value:
-                best_rank = rank
-                best_kickers = kickers
-            elif rank.value == best_rank.value:
-                for i in range(len(kickers)):
-                    if kickers[i] > best_kickers[i]:
-                        best_kickers = kickers
-                        break
-                    if kickers[i] < best_kickers[i]:
-                        break
-        return best_rank, best_kickers
-
-    def _evaluate_preliminary(self, cards: List[Card]):
-        ranks = [c.rank for c in cards]
-        rank_counts = Counter(ranks)
-
-        if 4 in rank_counts.values(): return HandRank.FOUR_OF_A_KIND, sorted(ranks, reverse=True)
-        if 3 in rank_counts.values(): return HandRank.THREE_OF_A_KIND, sorted(ranks, reverse=True)
-        if list(rank_counts.values()).count(2) >= 1: return HandRank.PAIR, sorted(ranks, reverse=True)
-
-        return HandRank.HIGH_CARD, sorted(ranks, reverse=True)
-
-    def _evaluate_five_card_hand(self, hand: List[Card]) -> Tuple[HandRank, List[int]]:
-        ranks = sorted([c.rank for c in hand], reverse=True)
-        suits = [c.suit for c in hand]
-        rank_counts = Counter(ranks)
-
-        is_flush = len(set(suits)) == 1
-
-        is_straight = False
-        unique_ranks = sorted(list(set(ranks)))
-        # Ace-low straight check
-        if set(ranks) == {14, 2, 3, 4, 5}:
-            is_straight = True
-            ranks = [5, 4, 3, 2, 1] # Re-order for tie-breaking
-        elif len(unique_ranks) >= 5:
-            for i in range(len(unique_ranks) - 4):
-                if unique_ranks[i] - unique_ranks[i+4] == -4:
-                    is_straight = True
-                    break
-
-        if is_straight and is_flush: return HandRank.STRAIGHT_FLUSH, ranks
-
-        counts = sorted(rank_counts.values(), reverse=True)
-        main_ranks = sorted(rank_counts.keys(), key=lambda r: (rank_counts[r], r), reverse=True)
-
-        if counts[0] == 4: return HandRank.FOUR_OF_A_KIND, main_ranks
-        if counts == [3, 2]: return HandRank.FULL_HOUSE, main_ranks
-        if is_flush: return HandRank.FLUSH, ranks
-        if is_straight: return HandRank.STRAIGHT, ranks
-        if counts[0] == 3: return HandRank.THREE_OF_A_KIND, main_ranks
-        if counts == [2, 2, 1]: return HandRank.TWO_PAIR, main_ranks
-        if counts[0] == 2: return HandRank.PAIR, main_ranks
+            return self._evaluate_preliminary([((code >> 8) & 0xF) + 2 for code in all_codes])
+        return _unpack_hand_value(self.hand_value(all_codes))
+
+    def hand_value(self, codes: List[int]) -> int:
+        """Packed value of the best hand in 5-7 valid card codes; higher is better."""
+        # Non-flush hands are keyed by the product of rank primes, flushes by
+        # the rank bits of each suit; both are a single table read.
+        product = 1
+        suited = [0] * 9
+        for code in codes:
+            product *= code & 0xFF
+            suited[(code >> 12) & 0xF] |= code >> 16
+
+        value = UNSUITED_RANKS[product]
+        for mask in (suited[1], suited[2], suited[4], suited[8]):
+            if FLUSH_RANKS[mask] > value:
+                value = FLUSH_RANKS[mask]
+        return value
+
+    def _evaluate_preliminary(self, ranks: List[int]):
+        ranks = sorted(ranks, reverse=True)
+        rank_hist = _rank_hist(ranks)
+
+        if 4 in rank_hist: return HandRank.FOUR_OF_A_KIND, ranks
+        if 3 in rank_hist: return HandRank.THREE_OF_A_KIND, ranks
+        if 2 in rank_hist: return HandRank.PAIR, ranks
 
         return HandRank.HIGH_CARD, ranks
 
+    def _evaluate_unsuited(self, ranks: List[int]) -> Tuple[HandRank, List[int]]:
+        """Best non-flush 5-card hand from 5-7 ranks, built from the rank histogram."""
+        rank_hist = _rank_hist(ranks)
+        # Ranks ordered by (count, rank), highest first
+        main_ranks = [r for count in (4, 3, 2, 1) for r in range(14, 1, -1) if rank_hist[r] == count]
+        counts = [rank_hist[r] for r in main_ranks]
+
+        if counts[0] == 4: return HandRank.FOUR_OF_A_KIND, [main_ranks[0], max(main_ranks[1:])]
+        if counts[0] == 3 and counts[1] >= 2: return HandRank.FULL_HOUSE, main_ranks[:2]
+
+        straight_high = _straight_high(sum(1 << (r - 2) for r in main_ranks))
+        if straight_high: return HandRank.STRAIGHT, list(range(straight_high, straight_high - 5, -1))
+
+        if counts[0] == 3: return HandRank.THREE_OF_A_KIND, main_ranks[:3]
+        if counts[0] == 2 and counts[1] == 2: return HandRank.TWO_PAIR, main_ranks[:2] + [max(main_ranks[2:])]
+        if counts[0] == 2: return HandRank.PAIR, main_ranks[:4]
+
+        return HandRank.HIGH_CARD, main_ranks[:5]
+
+    def _evaluate_flush(self, rank_mask: int) -> Tuple[HandRank, List[int]]:
+        """Best 5-card hand from the ranks of a single suit holding 5-7 cards."""
+        straight_high = _straight_high(rank_mask)
+        if straight_high: return HandRank.STRAIGHT_FLUSH, list(range(straight_high, straight_high - 5, -1))
+        return HandRank.FLUSH, [r + 2 for r in range(12, -1, -1) if rank_mask >> r & 1][:5]
+
+def _straight_high(rank_mask: int) -> int:
+    """High card of the best straight in a 13-bit rank mask, or 0 if there is none."""
+    for k in range(8, -1, -1):
+        if (rank_mask >> k) & 0x1F == 0x1F: return k + 6
+    # Ace-low straight: A, 2, 3, 4, 5
+    if rank_mask & 0x100F == 0x100F: return 5
+    return 0
+
+def _build_lookup_tables() -> Tuple[array, dict]:
+    """Precomputes packed hand values for every 5-7 card rank combination.
+
+    Flushes are indexed by the 13-bit rank mask of the flush suit; all other
+    hands by the product of their rank primes.
+    """
+    evaluator = HandEvaluator()
+    flush_ranks = array('I', [0]) * 8192
+    unsuited_ranks = {}
+
+    for size in (5, 6, 7):
+        for combo in combinations(range(13), size):
+            mask = sum(1 << r for r in combo)
+            flush_ranks[mask] = _pack_hand_value(*evaluator._evaluate_flush(mask))
+
+        for combo in combinations_with_replacement(range(13), size):
+            # Combos are sorted, so five of a rank would span five positions
+            if any(combo[i] == combo[i + 4] for i in range(size - 4)): continue
+            product = 1
+            for r in combo:
+                product *= RANK_PRIMES[r]
+            unsuited_ranks[product] = _pack_hand_value(*evaluator._evaluate_unsuited([r + 2 for r in combo]))
+
+    return flush_ranks, unsuited_ranks
+
+FLUSH_RANKS, UNSUITED_RANKS = _build_lookup_tables()
+
+def _expand_token(token: str) -> set:
+    """Expands a range token such as '77+', 'ATs+', '22-99' or 'A2s-A7s' into hand codes."""
+    if '-' in token:
+        start, end = token.split('-')
+        if start[0] == start[1]: # Pair span like '22-99'
+            lo, hi = sorted((RANK_CHARS.index(start[0]), RANK_CHARS.index(end[0])))
+            return {RANK_CHARS[r] * 2 for r in range(lo, hi + 1)}
+        lo, hi = sorted((RANK_CHARS.index(start[1]), RANK_CHARS.index(end[1])))
+        return {start[0] + RANK_CHARS[r] + start[2] for r in range(lo, hi + 1)}
+    if token.endswith('+'):
+        token = token[:-1]
+        if token[0] == token[1]: # Pair range like '99+'
+            return {RANK_CHARS[r] * 2 for r in range(RANK_CHARS.index(token[0]), 13)}
+        # Kicker range like 'ATs+' or 'AJo+', up to one below the top card
+        return {token[0] + RANK_CHARS[r] + token[2] for r in range(RANK_CHARS.index(token[1]), RANK_CHARS.index(token[0]))}
+    return {token}
+
+def _compile_ranges(ranges):
+    """Replaces every range list in a nested range dict with a frozenset of hand codes."""
+    if isinstance(ranges, dict):
+        return {key: _compile_ranges(value) for key, value in ranges.items()}
+    return frozenset().union(*(_expand_token(token) for token in ranges))
+
 # --- The Main Bot Class ---
 
+EQUITY_TRIALS = 1000 # Monte-Carlo run-outs per draw equity estimate
+
 class GTOPlayer(Bot):
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         super().__init__()
         self.hand: List[Card] = []
+        self.hand_codes: List[int] = []
         self.evaluator = HandEvaluator()
         self.is_preflop_aggressor = False
         self.all_player_ids = []
+        self._my_index = None
+        self._bb_index = None
+        self._position = 'LATE'
+        self._id_str = ''
+        self._hand_str = ''
+        # Shared by bluffing and Monte-Carlo equity; pass a seed only for reproducible runs
+        self._rng = random.Random(seed)
+        self._cc_key = None
+        self._cc: List[int] = []
 
         # Simplified GTO-inspired Pre-flop Ranges
         self.preflop_ranges = {
@@ -152,53 +280,73 @@ class GTOPlayer(Bot):
                 'vs_raise': {'3bet': ['99+', 'AJs+', 'AQo+'], 'call': ['22-88', 'A2s-ATs', 'KJs+', 'QTs+']}
             }
         }
+        # Expand the range notation once so lookups are a set membership test
+        self.preflop_ranges = _compile_ranges(self.preflop_ranges)
+
+    def set_id(self, player_id: int):
+        super().set_id(player_id)
+        # player_bets is keyed by the string form of the id
+        self._id_str = str(player_id)
 
     def on_start(self, starting_chips: int, player_hands: List[str], blind_amount: int, big_blind_player_id: int, small_blind_player_id: int, all_players: List[int]):
         self.all_player_ids = all_players
+        # Seating is fixed for the game, so resolve both seats once
+        try:
+            self._my_index = all_players.index(self.id)
+            self._bb_index = all_players.index(big_blind_player_id)
+        except ValueError:
+            self._my_index = self._bb_index = None
         my_hand_str = player_hands[0]
-        self.hand = [Card(c) for c in my_hand_str.split(" ")]
-        print(f"Player {self.id} started game with hand {self.hand}")
+        self.hand = [get_card(c) for c in my_hand_str.split(" ")]
+        # Hot paths work on the packed card codes; Card objects are kept for display
+        self.hand_codes = [c.code for c in self.hand]
+        self._hand_str = self._get_hand_string()
+        if BOT_DEBUG:
+            print(f"Player {self.id} started game with hand {self.hand}")
 
     def on_round_start(self, round_state: RoundStateClient, remaining_chips: int):
         self.is_preflop_aggressor = False
-        print(f"--- Round {round_state.round} ---")
+        self._position = self._get_position()
+        if BOT_DEBUG:
+            print(f"--- Round {round_state.round} ---")
 
     def get_action(self, round_state: RoundStateClient, remaining_chips: int) -> Tuple[PokerAction, int]:
-        amount_to_call = round_state.current_bet - round_state.player_bets.get(str(self.id), 0)
+        amount_to_call = round_state.current_bet - round_state.player_bets.get(self._id_str, 0)
 
         if round_state.round == 'Preflop':
             return self._get_preflop_action(round_state, amount_to_call)
 
-        community_cards = self.community_cards(round_state)
-        hand_rank, _ = self.evaluator.evaluate(self.hand, community_cards)
-        hand_category = self._categorize_hand(hand_rank, self.hand, community_cards)
+        community_codes = self.community_codes(round_state)
+        hand_rank, _ = self.evaluator.evaluate(self.hand_codes, community_codes)
+        hand_category = self._categorize_hand(hand_rank, self.hand_codes, community_codes)
+        hc_v = hand_category.value
         pot_size = round_state.pot
 
         if amount_to_call == 0: # We can check or bet
             if self.is_preflop_aggressor:
-                if hand_category.value >= HandCategory.STRONG_MADE.value or hand_category.value == HandCategory.STRONG_DRAW.value:
+                if hc_v >= STRONG_MADE_V or hc_v == STRONG_DRAW_V:
                     return self._make_bet(round_state, int(pot_size * 0.66))
-                elif hand_category.value == HandCategory.AIR.value and random.random() < 0.4:
+                elif hc_v == AIR_V and self._rng.random() < 0.4:
                     return self._make_bet(round_state, int(pot_size * 0.4))
                 else:
                     return PokerAction.CHECK, 0
             else:
-                if hand_category.value >= HandCategory.MEDIUM_MADE.value:
+                if hc_v >= MEDIUM_MADE_V:
                     return self._make_bet(round_state, int(pot_size * 0.5))
                 else:
                     return PokerAction.CHECK, 0
         else: # Facing a bet
             pot_odds = amount_to_call / (pot_size + amount_to_call) if (pot_size + amount_to_call) > 0 else 0
 
-            if hand_category.value == HandCategory.MONSTER.value:
+            if hc_v == MONSTER_V:
                 return self._make_raise(round_state, int(pot_size * 1.5 + amount_to_call))
-            if hand_category.value >= HandCategory.STRONG_MADE.value:
+            if hc_v >= STRONG_MADE_V:
                 return PokerAction.CALL, amount_to_call
-            if hand_category.value == HandCategory.STRONG_DRAW.value:
-                equity = self._estimate_draw_equity(community_cards)
+            if hc_v == STRONG_DRAW_V:
+                equity = self._estimate_draw_equity(community_codes)
                 if equity > pot_odds:
                     return PokerAction.CALL, amount_to_call
-            if hand_category.value >= HandCategory.WEAK_MADE.value:
+            if hc_v >= WEAK_MADE_V:
                 if amount_to_call <= pot_size * 0.5:
                     return PokerAction.CALL, amount_to_call
 
@@ -211,8 +359,7 @@ class GTOPlayer(Bot):
         pass
 
     def _get_preflop_action(self, round_state: RoundStateClient, amount_to_call: int):
-        position = self._get_position(round_state)
-        ranges = self.preflop_ranges[position]
+        ranges = self.preflop_ranges[self._position]
 
         has_raise = any(action == "Raise" for action in round_state.player_actions.values())
 
@@ -233,15 +380,11 @@ class GTOPlayer(Bot):
             else:
                 return PokerAction.FOLD, 0
 
-    def _get_position(self, round_state: RoundStateClient) -> str:
+    def _get_position(self) -> str:
         player_count = len(self.all_player_ids)
         if player_count <= 3: return 'LATE'
-        try:
-            my_index = self.all_player_ids.index(self.id)
-            bb_index = self.all_player_ids.index(round_state.big_blind_player_id)
-            relative_pos = (my_index - bb_index + player_count) % player_count
-        except ValueError:
-            return 'LATE' # Fallback
+        if self._my_index is None: return 'LATE' # Fallback
+        relative_pos = (self._my_index - self._bb_index + player_count) % player_count
 
         if relative_pos in [player_count - 1, player_count - 2]: return 'BLINDS'
         if relative_pos == player_count - 3: return 'LATE' # Button
@@ -249,74 +392,70 @@ class GTOPlayer(Bot):
         if relative_pos == player_count - 5: return 'MIDDLE'
         return 'EARLY'
 
-    def _is_in_range(self, range_list: List[str]) -> bool:
-        hand_str = self._get_hand_string()
-        c1, c2 = self.hand
-        for r in range_list:
-            if len(r) == 2: # Pair like '77'
-                if hand_str.startswith(r): return True
-            elif r.endswith('+'):
-                base_rank_str = r[1]
-                base_rank = Card(base_rank_str + 's').rank
-                if len(r) == 3 and r[0] == r[1]: # Pair range like '99+'
-                    if c1.rank == c2.rank and c1.rank >= base_rank: return True
-                elif r.endswith('s+') and hand_str.endswith('s'): # Suited range like 'ATs+'
-                    if hand_str[0] == r[0] and c2.rank >= base_rank: return True
-                elif r.endswith('o+') and hand_str.endswith('o'): # Offsuit range like 'AJo+'
-                    if hand_str[0] == r[0] and c2.rank >= base_rank: return True
-            elif r == hand_str:
-                return True
-        return False
+    def _is_in_range(self, range_set: frozenset) -> bool:
+        return self._hand_str in range_set
 
     def _get_hand_string(self) -> str:
-        c1, c2 = sorted(self.hand, key=lambda c: c.rank, reverse=True)
+        c1, c2 = sorted(self.hand, key=attrgetter('rank'), reverse=True)
         s = 's' if c1.suit == c2.suit else 'o'
         rank_map_rev = {10: 'T', 11: 'J', 12: 'Q', 13: 'K', 14: 'A'}
         r1 = rank_map_rev.get(c1.rank, str(c1.rank))
         r2 = rank_map_rev.get(c2.rank, str(c2.rank))
         return f"{r1}{r2}" if r1 == r2 else f"{r1}{r2}{s}"
 
-    def community_cards(self, round_state: RoundStateClient) -> List[Card]:
-        return [Card(c) for c in round_state.community_cards]
+    def community_codes(self, round_state: RoundStateClient) -> List[int]:
+        # The board only changes between streets, so reuse the parsed list
+        key = tuple(round_state.community_cards)
+        if key != self._cc_key:
+            self._cc_key = key
+            # Unknown card strings are dropped, matching what evaluate skips
+            self._cc = [CARD_INT[c] for c in key if c in CARD_INT]
+        return self._cc
 
-    def _categorize_hand(self, rank: HandRank, hand: List[Card], community: List[Card]) -> HandCategory:
+    def _categorize_hand(self, rank: HandRank, hand: List[int], community: List[int]) -> HandCategory:
         if rank.value >= HandRank.FULL_HOUSE.value: return HandCategory.MONSTER
-        if rank == HandRank.THREE_OF_A_KIND and hand[0].rank == hand[1].rank: return HandCategory.MONSTER
+        if rank == HandRank.THREE_OF_A_KIND and (hand[0] >> 8) & 0xF == (hand[1] >> 8) & 0xF: return HandCategory.MONSTER
         if rank.value >= HandRank.TWO_PAIR.value: return HandCategory.STRONG_MADE
 
         combined = hand + community
+        suit_masks = _suit_masks(combined)
         if len(combined) < 5:
-            suits = [c.suit for c in combined]
-            if Counter(suits).most_common(1)[0][1] == 4: return HandCategory.STRONG_DRAW
-            unique_ranks = sorted(list(set(c.rank for c in combined)))
-            if len(unique_ranks) >= 4:
-                for i in range(len(unique_ranks)-3):
-                    if unique_ranks[i+3] - unique_ranks[i] <= 4: return HandCategory.STRONG_DRAW
+            if max(m.bit_count() for m in suit_masks) == 4: return HandCategory.STRONG_DRAW
+            rank_mask = suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3]
+            # Four distinct ranks inside any five-rank window
+            if any(((rank_mask >> k) & 0x1F).bit_count() >= 4 for k in range(9)): return HandCategory.STRONG_DRAW
 
         if rank == HandRank.PAIR:
-            pair_rank = [r for r, c in Counter([c.rank for c in combined]).items() if c==2][0]
-            if pair_rank in [hand[0].rank, hand[1].rank] and pair_rank >= max([c.rank for c in community], default=0):
+            pair_mask = _paired_ranks(suit_masks)
+            hand_mask = (hand[0] >> 16) | (hand[1] >> 16)
+            board_mask = 0
+            for code in community:
+                board_mask |= code >> 16
+            if pair_mask & hand_mask and pair_mask.bit_length() >= board_mask.bit_length():
                 return HandCategory.STRONG_MADE
-            if pair_rank in [hand[0].rank, hand[1].rank]: return HandCategory.MEDIUM_MADE
+            if pair_mask & hand_mask: return HandCategory.MEDIUM_MADE
             return HandCategory.WEAK_MADE
 
         return HandCategory.AIR
 
-    def _estimate_draw_equity(self, community_cards: List[Card]) -> float:
-        outs = 0
-        combined = self.hand + community_cards
-        if Counter([c.suit for c in combined]).most_common(1)[0][1] == 4: outs += 9
-
-        unique_ranks = sorted(list(set(c.rank for c in combined)))
-        if len(unique_ranks) >= 4:
-            is_oesd = any(unique_ranks[i+3] - unique_ranks[i] == 3 for i in range(len(unique_ranks)-3))
-            if is_oesd: outs = max(outs, 8)
-            else:
-                is_gutshot = any(unique_ranks[i+3] - unique_ranks[i] == 4 for i in range(len(unique_ranks)-3))
-                if is_gutshot: outs = max(outs, 4)
-
-        multiplier = 4 if len(community_cards) == 3 else 2
-        return (outs * multiplier) / 100
+    def _estimate_draw_equity(self, board: List[int]) -> float:
+        """Monte-Carlo equity against one random hand over random board run-outs."""
+        hand = [code for code in self.hand_codes if code]
+        dead = set(hand + board)
+        remaining = [code for code in DECK if code not in dead]
+        needed = 2 + 5 - len(board)
+
+        hand_value = self.evaluator.hand_value
+        sample = self._rng.sample
+        wins = 0.0
+        for _ in range(EQUITY_TRIALS):
+            drawn = sample(remaining, needed)
+            runout = board + drawn[2:]
+            hero = hand_value(hand + runout)
+            villain = hand_value(drawn[:2] + runout)
+            if hero > villain: wins += 1
+            elif hero == villain: wins += 0.5
+        return wins / EQUITY_TRIALS
 
     def _make_bet(self, round_state: RoundStateClient, amount: int) -> Tuple[PokerAction, int]:
         amount = int(amount)
@@ -5,6 +5,7 @@ from typing import List, Tuple
 
 # Make sure you have these imports from your competition framework
 from bot import Bot
+from config import BOT_DEBUG
 from type.poker_action import PokerAction
 from type.round_state import RoundStateClient
 
@@ -157,11 +158,13 @@ class SimplePlayer(Bot):
         self.all_player_ids = all_players
         self.big_blind_player_id = big_blind_player_id
         self.hand = [Card(c) for c in player_hands]
-        print(f"Player {self.id} started game with hand {self.hand}")
+        if BOT_DEBUG:
+            print(f"Player {self.id} started game with hand {self.hand}")
 
     def on_round_start(self, round_state: RoundStateClient, remaining_chips: int):
         self.is_preflop_aggressor = False
-        print(f"--- Round {round_state.round} ---")
+        if BOT_DEBUG:
+            print(f"--- Round {round_state.round} ---")
 
     def get_action(self, round_state: RoundStateClient, remaining_chips: int) -> Tuple[PokerAction, int]:
         amount_to_call = round_state.current_bet - round_state.player_bets.get(str(self.id), 0)
@@ -1,6 +1,7 @@
 
 from typing import List
 from bot import Bot
+from config import BOT_DEBUG
 from type.poker_action import PokerAction
 from type.round_state import RoundStateClient
 from google import genai
@@ -10,20 +11,23 @@ class SimplePlayer(Bot):
         super().__init__()
 
     def on_start(self, starting_chips: int, player_hands: List[str], blind_amount: int, big_blind_player_id: int, small_blind_player_id: int, all_players: List[int]):
-        print("Player called on game start")
-        print("Player hands: ", player_hands)
-        print("Blind: ", blind_amount)
-        print("Big blind player id: ", big_blind_player_id)
-        print("Small blind player id: ", small_blind_player_id)
-        print("All players in game: ", all_players)
+        if BOT_DEBUG:
+            print("Player called on game start")
+            print("Player hands: ", player_hands)
+            print("Blind: ", blind_amount)
+            print("Big blind player id: ", big_blind_player_id)
+            print("Small blind player id: ", small_blind_player_id)
+            print("All players in game: ", all_players)
 
     def on_round_start(self, round_state: RoundStateClient, remaining_chips: int):
-        print("Player called on round start")
-        print("Round state: ", round_state)
+        if BOT_DEBUG:
+            print("Player called on round start")
+            print("Round state: ", round_state)
 
     def get_action(self, round_state: RoundStateClient, remaining_chips: int):
         """ Returns the action for the player. """
-        print("Player called get action")
+        if BOT_DEBUG:
+            print("Player called get action")
 
         raised = False
         for player_action in round_state.player_actions.values():
@@ -42,9 +46,11 @@ class SimplePlayer(Bot):
 
     def on_end_round(self, round_state: RoundStateClient, remaining_chips: int):
         """ Called at the end of the round. """
-        print("Player called on end round")
+        if BOT_DEBUG:
+            print("Player called on end round")
 
     def on_end_game(self, round_state: RoundStateClient, player_score: float, all_scores: dict, active_players_hands: dict):
-        print("Player called on end game, with player score: ", player_score)
-        print("All final scores: ", all_scores)
-        print("Active players hands: ", active_players_hands)
\ No newline at end of file
+        if BOT_DEBUG:
+            print("Player called on end game, with player score: ", player_score)
+            print("All final scores: ", all_scores)
+            print("Active players hands: ", active_players_hands)
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+Regression tests for the lookup-table hand evaluator in goat.py.
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from goat import CARD_INT, HandEvaluator, HandRank
+
+evaluator = HandEvaluator()
+
+def evaluate(hand: str, board: str):
+    return evaluator.evaluate([CARD_INT[c] for c in hand.split()], [CARD_INT[c] for c in board.split()])
+
+def test_straight_flush():
+    assert evaluate("9h Th", "Jh Qh Kh 2c 3d") == (HandRank.STRAIGHT_FLUSH, [13, 12, 11, 10, 9])
+
+def test_wheel_is_five_high():
+    assert evaluate("Ah 2c", "3d 4s 5h Kc 9d") == (HandRank.STRAIGHT, [5, 4, 3, 2, 1])
+
+def test_wheel_loses_to_six_high_straight():
+    assert evaluate("Ah 2c", "3d 4s 5h 6c 9d") == (HandRank.STRAIGHT, [6, 5, 4, 3, 2])
+
+def test_steel_wheel():
+    assert evaluate("Ad 2d", "3d 4d 5d Kc Ks") == (HandRank.STRAIGHT_FLUSH, [5, 4, 3, 2, 1])
+
+def test_flush_beats_straight():
+    assert evaluate("2h 7h", "8h 9c Th Jh 6d") == (HandRank.FLUSH, [11, 10, 8, 7, 2])
+
+def test_full_house_beats_flush():
+    assert evaluate("Kh Kd", "Kc 2h 2c 7h 9h") == (HandRank.FULL_HOUSE, [13, 2])
+
+def test_quads_take_best_kicker():
+    assert evaluate("9c 9d", "9h 9s 2c Ac Kd") == (HandRank.FOUR_OF_A_KIND, [9, 14])
+
+def test_three_pairs_keep_top_two():
+    assert evaluate("Qc Qd", "7h 7s 3c 3d 2h") == (HandRank.TWO_PAIR, [12, 7, 3])
+
+def test_two_trips_make_full_house():
+    assert evaluate("8c 8d", "8h 4s 4c 4d Ah") == (HandRank.FULL_HOUSE, [8, 4])
+
+def test_trips_on_seven_card_board():
+    assert evaluate("Jc 4d", "Jh Js 9c 6d 2h") == (HandRank.THREE_OF_A_KIND, [11, 9, 6])
+
+def test_pair_and_high_card():
+    assert evaluate("Ac 4d", "Ah Ts 9c 6d 2h") == (HandRank.PAIR, [14, 10, 9, 6])
+    assert evaluate("Ac 4d", "Kh Ts 9c 6d 2h") == (HandRank.HIGH_CARD, [14, 13, 10, 9, 6])
+
+def test_unknown_cards_are_skipped():
+    assert evaluator.evaluate([CARD_INT["Ah"], CARD_INT["Ad"]], [CARD_INT["2c"], CARD_INT["3c"], 0]) == (HandRank.PAIR, [14, 14, 3, 2])
+
+def test_hand_values_order_hands():
+    board = [CARD_INT[c] for c in "Ts 9s 2h 3d Kc".split()]
+    values = [evaluator.hand_value([CARD_INT[a], CARD_INT[b]] + board) for a, b in (("Qs", "Js"), ("Kd", "Kh"), ("Ac", "Kd"), ("Ad", "Qh"))]
+    assert values == sorted(values, reverse=True)